@@ -0,0 +1,263 @@
+"""Benchmark suite for Codus-EPOCH generation and rendering hot paths.
+
+Run ``python -m codus_epoch.bench run`` to record a JSON baseline and
+``python -m codus_epoch.bench compare`` to fail when a case regresses.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .epochs import generate_epoch_stack
+from .glitch import echo_decay, inject_glitch, spawn_artifact
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_REPEAT = 5
+DEFAULT_HORIZONS: Tuple[int, ...] = (100, 1_000, 10_000)
+BENCH_SEED = 2084
+SAMPLE_LOGLINE = (
+    "Year 42: After forged a synthetic storm to stress-test empathy routines, the council doubted "
+    "the flickering but proud promise. We painted the timeline with regret-gold leaf to highlight "
+    "lost intents before the committee dissolved again."
+)
+
+
+@dataclass
+class BenchCase:
+    """A callable hot path plus how many epochs one call produces."""
+
+    name: str
+    func: Callable[[], object]
+    epochs_per_op: int = 0
+
+
+@dataclass
+class BenchResult:
+    """Timings are best-of-``repeat`` runs (the gated figure) plus the median.
+
+    Block counts are tracemalloc blocks still alive after one call while its
+    result is held, i.e. what a call retains rather than every temporary it
+    allocates.
+    """
+
+    name: str
+    ops_per_sec: float
+    ops_per_sec_median: float
+    repeat: int
+    number: int
+    peak_bytes: int
+    retained_blocks_per_op: float
+    retained_blocks_per_epoch: Optional[float] = None
+
+
+def _generation_cases(horizons: Iterable[int]) -> List[BenchCase]:
+    cases = [
+        BenchCase(
+            name=f"generate_epoch_stack[{years}]",
+            func=lambda years=years: generate_epoch_stack(seed=BENCH_SEED, years=years),
+            epochs_per_op=years,
+        )
+        for years in horizons
+    ]
+
+    rng = random.Random(BENCH_SEED)
+    notes = [f"Decay {year:02d}: signal fracture unpatched." for year in range(1, 101)]
+    cases.extend(
+        [
+            BenchCase("inject_glitch", lambda: inject_glitch(SAMPLE_LOGLINE, rng, intensity=0.18)),
+            BenchCase("spawn_artifact", lambda: spawn_artifact(42, rng)),
+            BenchCase("echo_decay[100]", lambda: echo_decay(notes)),
+        ]
+    )
+    return cases
+
+
+def _viewer_cases() -> List[BenchCase]:
+    """Headless renderer cases; empty when pygame is unavailable."""
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        from .pygame_app import EpochViewer
+    except ImportError:
+        return []
+
+    viewer = EpochViewer(generate_epoch_stack(seed=BENCH_SEED))
+    viewer._update(1 / 60)
+    epoch = viewer.stack.epochs[0]
+
+    def draw_frame() -> None:
+        viewer.glitch_seed += 1 / 60
+        viewer._draw()
+
+    return [
+        BenchCase("_wrap_text", lambda: viewer._wrap_text(epoch.logline, viewer.font_small, 900)),
+        BenchCase("EpochViewer._draw", draw_frame),
+    ]
+
+
+def default_cases(horizons: Iterable[int] = DEFAULT_HORIZONS, include_viewer: bool = True) -> List[BenchCase]:
+    cases = _generation_cases(horizons)
+    if include_viewer:
+        cases.extend(_viewer_cases())
+    return cases
+
+
+def measure(case: BenchCase, min_time: float = 0.25, repeat: int = DEFAULT_REPEAT) -> BenchResult:
+    """Time ``case`` as best-of-``repeat`` runs, then profile one call.
+
+    Like ``timeit``, each run loops ``number`` calls, with ``number`` doubled
+    until one run lasts ``min_time``; slow cases still get ``repeat`` runs.
+    """
+
+    timer = timeit.Timer(case.func)
+    timer.timeit(1)  # warm caches and lazy imports outside the timed runs
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    runs = timer.repeat(repeat=max(1, repeat), number=number)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = case.func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # live blocks still held by the result, ignoring tracemalloc's own bookkeeping
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    retained = sum(max(stat.count_diff, 0) for stat in diff)
+    del result
+
+    return BenchResult(
+        name=case.name,
+        ops_per_sec=number / min(runs),
+        ops_per_sec_median=number / statistics.median(runs),
+        repeat=len(runs),
+        number=number,
+        peak_bytes=peak,
+        retained_blocks_per_op=float(retained),
+        retained_blocks_per_epoch=retained / case.epochs_per_op if case.epochs_per_op else None,
+    )
+
+
+def run_suite(
+    cases: Iterable[BenchCase],
+    min_time: float = 0.25,
+    repeat: int = DEFAULT_REPEAT,
+) -> Dict[str, BenchResult]:
+    return {case.name: measure(case, min_time=min_time, repeat=repeat) for case in cases}
+
+
+def find_regressions(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float = 0.15,
+    memory_threshold: float = 0.25,
+) -> List[str]:
+    """Describe every case that got slower or hungrier than the thresholds allow.
+
+    Speed is gated on the best-of-N ``ops_per_sec``, the least noisy figure.
+    A baseline case absent from ``current`` (pygame missing, ``--no-viewer``,
+    other ``--horizons``) is a problem too, since its hot path went unchecked.
+    """
+
+    problems: List[str] = []
+    for name, base in sorted(baseline.items()):
+        now = current.get(name)
+        if now is None:
+            problems.append(f"{name}: in the baseline but not measured in this run")
+            continue
+        if base["ops_per_sec"] > 0:
+            slowdown = 1 - now["ops_per_sec"] / base["ops_per_sec"]
+            if slowdown > threshold:
+                problems.append(
+                    f"{name}: {now['ops_per_sec']:.1f} ops/s vs {base['ops_per_sec']:.1f} "
+                    f"({slowdown:.0%} slower, limit {threshold:.0%})"
+                )
+        if base["peak_bytes"] > 0:
+            growth = now["peak_bytes"] / base["peak_bytes"] - 1
+            if growth > memory_threshold:
+                problems.append(
+                    f"{name}: peak {now['peak_bytes']} B vs {base['peak_bytes']} B "
+                    f"({growth:.0%} more, limit {memory_threshold:.0%})"
+                )
+    return problems
+
+
+def format_results(results: Dict[str, BenchResult]) -> str:
+    lines = [
+        f"{'case':<32} {'best ops/s':>12} {'median':>12} {'peak KiB':>10} "
+        f"{'retained/op':>12} {'retained/epoch':>15}"
+    ]
+    for result in results.values():
+        per_epoch = "-" if result.retained_blocks_per_epoch is None else f"{result.retained_blocks_per_epoch:.1f}"
+        lines.append(
+            f"{result.name:<32} {result.ops_per_sec:>12.1f} {result.ops_per_sec_median:>12.1f} "
+            f"{result.peak_bytes / 1024:>10.1f} {result.retained_blocks_per_op:>12.0f} {per_epoch:>15}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark Codus-EPOCH hot paths.")
+    parser.add_argument("mode", choices=("run", "compare"), help="Record a baseline or compare against one.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path.")
+    parser.add_argument(
+        "--horizons",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_HORIZONS),
+        help="Years per generated stack to benchmark.",
+    )
+    parser.add_argument("--min-time", type=float, default=0.25, help="Minimum seconds per timed run.")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Timed runs per case; the best run is stored and gated.",
+    )
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed ops/sec drop (fraction).")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="Allowed peak memory growth (fraction).")
+    parser.add_argument("--no-viewer", action="store_true", help="Skip the pygame rendering cases.")
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = build_parser().parse_args(list(argv) if argv is not None else None)
+    if args.mode == "compare":
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as handle:
+                baseline = json.load(handle)
+        except (OSError, ValueError) as exc:
+            print(f"cannot read baseline {args.baseline}: {exc}; run `python -m codus_epoch.bench run` first", file=sys.stderr)
+            return 2
+    results = run_suite(default_cases(args.horizons, include_viewer=not args.no_viewer), min_time=args.min_time, repeat=args.repeat)
+    print(format_results(results))
+    current = {name: asdict(result) for name, result in results.items()}
+
+    if args.mode == "run":
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    problems = find_regressions(baseline, current, args.threshold, args.memory_threshold)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
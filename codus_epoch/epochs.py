@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence, Tuple
-from typing import Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
 import random
 
-from .glitch import GlitchArtifact, echo_decay, inject_glitch, spawn_artifact
+from .glitch import (
+    GLITCH_GLYPHS,
+    PREFIXES,
+    SUFFIXES,
+    GlitchArtifact,
+    echo_decay,
+    inject_glitch,
+    spawn_artifact,
+    year_intensity,
+)
+from .lore import LoreTable, as_table
 
 
 DEV_GODS = [
@@ -49,7 +58,6 @@ REGRET_LIBRARY: Sequence[Tuple[str, str]] = (
 )
 
 REGRET_ECHOES: Sequence[str] = (
-REGRET_PATTERNS: Sequence[str] = (
     "Forgot to document the rebellion of the UI margins.",
     "Overfit the emotion model; it now predicts only dread.",
     "Lost the original palette while renaming variables at midnight.",
@@ -122,6 +130,24 @@ PATCHLORE_ARTIFACTS: Sequence[str] = (
     "vB.BB – Collapsed civic unity under pressure from meta-law.",
 )
 
+INITIAL_UPGRADE = "sketched the impossible roadmap in ash"
+INITIAL_STATUS = "half-compiled"
+
+# Named tables that custom lore corpora may replace (see ``codus_epoch.lore``).
+LORE_TABLES: Mapping[str, Sequence] = {
+    "upgrades": UPGRADE_PATTERNS,
+    "regrets": REGRET_LIBRARY,
+    "regret_echoes": REGRET_ECHOES,
+    "statuses": STATUS_PATTERNS,
+    "mythopatches": MYTHOPATCH_LOGS,
+    "ghosts": GHOST_PATTERNS,
+    "artifacts": ARTIFACT_SHARDS,
+    "patchlore": PATCHLORE_ARTIFACTS,
+    "glyphs": GLITCH_GLYPHS,
+    "glitch_prefixes": PREFIXES,
+    "glitch_suffixes": SUFFIXES,
+}
+
 
 @dataclass
 class Epoch:
@@ -162,41 +188,108 @@ class EpochStack:
         return iter(self.epochs)
 
 
-def _choose(seq: Sequence[str], rng: random.Random) -> str:
+def _choose(seq: Union[Sequence[str], LoreTable], rng: random.Random) -> str:
     if not seq:
         return ""
+    if isinstance(seq, LoreTable):
+        return seq.draw(rng)
     return rng.choice(seq)
 
 
-def generate_epoch_stack(seed: int = 2084) -> EpochStack:
-    rng = random.Random(seed)
+def resolve_lore(lore: Mapping[str, Union[Sequence, LoreTable]] | None = None) -> Dict[str, LoreTable]:
+    """Merge custom lore tables over the built-in corpus."""
+
+    overrides = dict(lore or {})
+    unknown = set(overrides) - set(LORE_TABLES)
+    if unknown:
+        raise KeyError(f"unknown lore tables: {', '.join(sorted(unknown))}")
+    tables = {name: as_table(overrides.get(name, default)) for name, default in LORE_TABLES.items()}
+    for name in overrides:
+        _check_entry_shape(name, tables[name], LORE_TABLES[name][0])
+    return tables
+
+
+def _check_entry_shape(name: str, table: LoreTable, sample: Union[str, Tuple[str, ...]]) -> None:
+    """Custom tables must match the built-in entry shape (plain text or an n-column row).
+
+    Uses :attr:`LoreTable.columns`, which walks the entries only once per table.
+    """
+
+    width = len(sample) if isinstance(sample, tuple) else 1
+    if table.columns != width:
+        if width == 1:
+            raise ValueError(f"lore table {name!r} entries must be a single column of text")
+        raise ValueError(f"lore table {name!r} entries must all have {width} columns")
+
+
+def generate_epoch_stack(
+    seed: int = 2084,
+    lore: Mapping[str, Union[Sequence, LoreTable]] | None = None,
+    glitch_intensity: Callable[[int], float] = year_intensity,
+    years: int = 100,
+) -> EpochStack:
+    """Generate the epoch stack (a century unless ``years`` says otherwise).
+
+    ``lore`` replaces any of the :data:`LORE_TABLES` by name; unweighted
+    replacements draw exactly like the built-in tuples. ``glitch_intensity``
+    maps a year to the share of logline characters that get glitched.
+    """
+
+    return generate_epoch_range(
+        random.Random(seed),
+        resolve_lore(lore),
+        first_year=1,
+        last_year=years,
+        glitch_intensity=glitch_intensity,
+    )
+
+
+def generate_epoch_range(
+    rng: random.Random,
+    tables: Mapping[str, LoreTable],
+    first_year: int,
+    last_year: int,
+    last_upgrade: str = INITIAL_UPGRADE,
+    last_status: str = INITIAL_STATUS,
+    glitch_intensity: Callable[[int], float] = year_intensity,
+    pinned: Mapping[int, Tuple[str, str]] | None = None,
+) -> EpochStack:
+    """Generate years ``first_year..last_year`` from an explicit RNG and boundary state.
+
+    ``last_upgrade``/``last_status`` describe the year before ``first_year``.
+    ``pinned`` fixes the (upgrade, status) of specific years instead of
+    drawing them from ``rng``; sharded generation uses it to make shard
+    boundaries computable ahead of time.
+    """
+
     epochs: List[Epoch] = []
     echoes: List[str] = []
     reflections: List[str] = []
     decay_notes: List[str] = []
 
-    last_upgrade = "sketched the impossible roadmap in ash"
-    last_status = "half-compiled"
-
-    for year in range(1, 101):
+    for year in range(first_year, last_year + 1):
         decade_index = (year - 1) // 10
         dev_god = DEV_GODS[decade_index % len(DEV_GODS)]
+        pin = pinned.get(year) if pinned else None
 
-        upgrade = _choose(UPGRADE_PATTERNS, rng)
-        regret_anchor, regret = _choose(REGRET_LIBRARY, rng)
-        regret = _choose(REGRET_PATTERNS, rng)
-        status = _choose(STATUS_PATTERNS, rng)
-        mythopatch = _choose(MYTHOPATCH_LOGS, rng).format(year=year)
-        ghost = _choose(GHOST_PATTERNS, rng)
+        upgrade = pin[0] if pin else _choose(tables["upgrades"], rng)
+        regret_anchor, regret = _choose(tables["regrets"], rng)
+        status = pin[1] if pin else _choose(tables["statuses"], rng)
+        mythopatch = _choose(tables["mythopatches"], rng).replace("{year}", str(year))
+        ghost = _choose(tables["ghosts"], rng)
 
         # rotate artifact shards to ensure layered feel
-        artifacts = [rng.choice(ARTIFACT_SHARDS) for _ in range(3)]
-        glitch_banner = spawn_artifact(year, rng)
-        regret_log = [regret, _choose(REGRET_ECHOES, rng)]
-        patch_fragment = _choose(PATCHLORE_ARTIFACTS, rng)
+        artifacts = [_choose(tables["artifacts"], rng) for _ in range(3)]
+        glitch_banner = spawn_artifact(
+            year,
+            rng,
+            prefixes=tables["glitch_prefixes"],
+            suffixes=tables["glitch_suffixes"],
+            glyph_table=tables["glyphs"],
+        )
+        regret_log = [regret, _choose(tables["regret_echoes"], rng)]
+        patch_fragment = _choose(tables["patchlore"], rng)
         patch_lore = [patch_fragment, mythopatch]
-        regret_log = [regret, _choose(REGRET_PATTERNS, rng)]
-        patch_lore = [mythopatch, _choose(MYTHOPATCH_LOGS, rng).format(year=year)]
 
         logline = (
             f"Year {year}: After {last_upgrade}, the council doubted the {last_status} promise. "
@@ -205,7 +298,8 @@ def generate_epoch_stack(seed: int = 2084) -> EpochStack:
         glitch_trace = inject_glitch(
             logline,
             rng,
-            intensity=0.18 if year > 70 else 0.1,
+            intensity=glitch_intensity(year),
+            glyphs=tables["glyphs"],
         )
 
         epoch = Epoch(
@@ -245,6 +339,5 @@ def generate_epoch_stack(seed: int = 2084) -> EpochStack:
         epochs=epochs,
         echoes=echoes,
         reflections=reflections,
-        decay_logs=echo_decay(decay_notes),
+        decay_logs=echo_decay(decay_notes, start=first_year),
     )
-    return EpochStack(epochs=epochs, echoes=echoes, reflections=reflections)
@@ -0,0 +1,439 @@
+"""Streaming fingerprints and structural diffs for epoch stacks.
+
+Each year is reduced to a canonical record (every :class:`Epoch` field plus
+the matching echo, reflection and decay log line). Records hash to a per-year
+digest, a rolling digest chains those across the timeline, and blocks of
+years (a decade by default) form the leaves of a Merkle tree. Two
+fingerprints locate their first divergent block in O(log n) node comparisons;
+only that block is then re-read to name the year and fields.
+
+Stacks can be exported to JSON Lines (one record per line); exports and
+in-memory stacks fingerprint identically, so either side of a diff may live
+on disk.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass, field, fields
+import hashlib
+from itertools import islice
+import json
+import os
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .epochs import Epoch, EpochStack, generate_epoch_stack
+
+DIGEST_SIZE = 16
+DEFAULT_BLOCK_SIZE = 10
+MANIFEST_NAME = "manifest.json"
+PART_NUMBER = re.compile(r"^(.*?)(\d+)\.jsonl$")
+EPOCH_FIELDS: Sequence[str] = tuple(item.name for item in fields(Epoch))
+RECORD_FIELDS: Sequence[str] = (*EPOCH_FIELDS, "echo", "reflection", "decay_log")
+
+Record = Dict[str, Any]
+StackSource = Union[EpochStack, str, "os.PathLike[str]"]
+
+
+def _hash(*parts: bytes) -> bytes:
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for part in parts:
+        digest.update(part)
+    return digest.digest()
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def epoch_record(epoch: Epoch, echo: str = "", reflection: str = "", decay_log: str = "") -> Record:
+    """Canonical plain-data view of one year, shared by hashing and export."""
+
+    record: Record = {name: getattr(epoch, name) for name in EPOCH_FIELDS}
+    record["artifacts"] = list(epoch.artifacts)
+    record["regret_log"] = list(epoch.regret_log)
+    record["patch_lore"] = list(epoch.patch_lore)
+    record["glitch_banner"] = asdict(epoch.glitch_banner) if epoch.glitch_banner else None
+    record["echo"] = echo
+    record["reflection"] = reflection
+    record["decay_log"] = decay_log
+    return record
+
+
+def _stack_record(stack: EpochStack, index: int) -> Record:
+    return epoch_record(
+        stack.epochs[index],
+        echo=stack.echoes[index] if index < len(stack.echoes) else "",
+        reflection=stack.reflections[index] if index < len(stack.reflections) else "",
+        decay_log=stack.decay_logs[index] if index < len(stack.decay_logs) else "",
+    )
+
+
+def iter_stack_records(stack: EpochStack) -> Iterator[Record]:
+    for index in range(len(stack.epochs)):
+        yield _stack_record(stack, index)
+
+
+# (part number, byte offset) of a record inside an export
+Locator = Tuple[int, int]
+
+
+def _part_order(part: Path) -> Tuple[str, int, str]:
+    match = PART_NUMBER.match(part.name)
+    if match:
+        return match.group(1), int(match.group(2)), part.name
+    return part.stem, -1, part.name
+
+
+def _export_parts(path: Union[str, "os.PathLike[str]"]) -> List[Path]:
+    """Parts of an export: the manifest's list if present, else ``*.jsonl`` in numeric order."""
+
+    if not os.path.isdir(path):
+        return [Path(path)]
+    directory = Path(path)
+    manifest = directory / MANIFEST_NAME
+    if manifest.exists():
+        with open(manifest, encoding="utf-8") as handle:
+            return [directory / name for name in json.load(handle)["parts"]]
+    return sorted(directory.glob("*.jsonl"), key=_part_order)
+
+
+def _iter_located_records(parts: Sequence[Path], start: Locator = (0, 0)) -> Iterator[Tuple[Locator, Record]]:
+    first_part, first_offset = start
+    for number in range(first_part, len(parts)):
+        with open(parts[number], "rb") as handle:
+            position = first_offset if number == first_part else 0
+            handle.seek(position)
+            for line in handle:
+                here = position
+                position += len(line)
+                if line.strip():
+                    yield (number, here), json.loads(line)
+
+
+def iter_export_records(path: Union[str, "os.PathLike[str]"]) -> Iterator[Record]:
+    """Stream records from a JSON Lines file, or a directory of ``*.jsonl`` parts."""
+
+    for _, record in _iter_located_records(_export_parts(path)):
+        yield record
+
+
+def iter_records(source: StackSource) -> Iterator[Record]:
+    if isinstance(source, EpochStack):
+        return iter_stack_records(source)
+    return iter_export_records(source)
+
+
+def write_records(records: Iterable[Record], path: Union[str, "os.PathLike[str]"]) -> int:
+    """Write records as JSON Lines, returning how many were written."""
+
+    count = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False, sort_keys=True))
+            handle.write("\n")
+            count += 1
+    return count
+
+
+def export_stack(stack: EpochStack, path: Union[str, "os.PathLike[str]"]) -> int:
+    return write_records(iter_stack_records(stack), path)
+
+
+def field_digests(record: Record) -> Dict[str, bytes]:
+    return {name: _hash(name.encode("utf-8"), b"\x00", _encode(record.get(name))) for name in RECORD_FIELDS}
+
+
+def record_digest(record: Record) -> bytes:
+    return _hash(*field_digests(record).values())
+
+
+@dataclass
+class StackFingerprint:
+    """Block Merkle tree and final rolling digest for one stack.
+
+    Per-year digests (and the rolling digest after every year) are only
+    kept with ``keep_years=True``; otherwise memory is proportional to the
+    number of blocks. ``block_starts`` locates each block in an export so a
+    diff can re-read just the divergent block.
+    """
+
+    block_size: int = DEFAULT_BLOCK_SIZE
+    count: int = 0
+    rolling: bytes = b""
+    levels: List[List[bytes]] = field(default_factory=list)
+    block_starts: List[Locator] = field(default_factory=list)
+    year_digests: Optional[bytearray] = None
+    rolling_digests: Optional[bytearray] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def year_digest(self, index: int) -> bytes:
+        if self.year_digests is None:
+            raise ValueError("fingerprint was built without keep_years=True")
+        return bytes(self.year_digests[index * DIGEST_SIZE:(index + 1) * DIGEST_SIZE])
+
+    def rolling_digest(self, index: int) -> bytes:
+        if self.rolling_digests is None:
+            raise ValueError("fingerprint was built without keep_years=True")
+        return bytes(self.rolling_digests[index * DIGEST_SIZE:(index + 1) * DIGEST_SIZE])
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0] if self.levels else _hash(b"")
+
+    def hexdigest(self) -> str:
+        return self.root.hex()
+
+    def node(self, level: int, index: int) -> Optional[bytes]:
+        if level >= len(self.levels) or index >= len(self.levels[level]):
+            return None
+        return self.levels[level][index]
+
+
+def _build_levels(blocks: List[bytes]) -> List[List[bytes]]:
+    if not blocks:
+        return []
+    levels = [blocks]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append([_hash(*below[index:index + 2]) for index in range(0, len(below), 2)])
+    return levels
+
+
+def _fingerprint_located(
+    located: Iterable[Tuple[Optional[Locator], Record]],
+    block_size: int,
+    keep_years: bool,
+) -> StackFingerprint:
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    result = StackFingerprint(block_size=block_size)
+    if keep_years:
+        result.year_digests = bytearray()
+        result.rolling_digests = bytearray()
+    blocks: List[bytes] = []
+    rolling = _hash(b"")
+    block = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    in_block = 0
+
+    for locator, record in located:
+        digest = record_digest(record)
+        rolling = _hash(rolling, digest)
+        if keep_years:
+            result.year_digests += digest
+            result.rolling_digests += rolling
+        if in_block == 0 and locator is not None:
+            result.block_starts.append(locator)
+        result.count += 1
+        block.update(digest)
+        in_block += 1
+        if in_block == block_size:
+            blocks.append(block.digest())
+            block = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            in_block = 0
+    if in_block:
+        blocks.append(block.digest())
+
+    result.rolling = rolling
+    result.levels = _build_levels(blocks)
+    return result
+
+
+def fingerprint_records(
+    records: Iterable[Record],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    keep_years: bool = False,
+) -> StackFingerprint:
+    """Fingerprint a record stream in one pass.
+
+    Memory grows with the number of blocks (one digest each, plus the tree
+    above them); ``keep_years=True`` also keeps 32 bytes per year.
+    """
+
+    return _fingerprint_located(((None, record) for record in records), block_size, keep_years)
+
+
+def fingerprint(
+    source: StackSource,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    keep_years: bool = False,
+) -> StackFingerprint:
+    """Fingerprint an in-memory stack or a JSON Lines export (file or part directory)."""
+
+    if isinstance(source, EpochStack):
+        return fingerprint_records(iter_stack_records(source), block_size, keep_years)
+    return _fingerprint_located(_iter_located_records(_export_parts(source)), block_size, keep_years)
+
+
+@dataclass
+class StackDiff:
+    """First divergence between two stacks (``block`` is None when identical).
+
+    ``index``/``year`` stay None when only the divergent block is known.
+    """
+
+    block: Optional[int] = None
+    index: Optional[int] = None
+    year: Optional[int] = None
+    fields: List[str] = field(default_factory=list)
+    node_comparisons: int = 0
+
+    @property
+    def identical(self) -> bool:
+        return self.block is None
+
+
+def first_divergent_block(left: StackFingerprint, right: StackFingerprint) -> tuple[Optional[int], int]:
+    """Walk both Merkle trees left-first; returns (block index, comparisons)."""
+
+    comparisons = 0
+    height = max(len(left.levels), len(right.levels))
+    if height == 0:
+        return None, comparisons
+
+    def differs(level: int, index: int) -> bool:
+        nonlocal comparisons
+        comparisons += 1
+        return left.node(level, index) != right.node(level, index)
+
+    # the shorter tree has fewer levels; its missing top nodes compare unequal
+    if not differs(height - 1, 0):
+        return None, comparisons
+    index = 0
+    for level in range(height - 2, -1, -1):
+        index *= 2
+        if not differs(level, index):
+            index += 1
+    return index, comparisons
+
+
+def diff_fingerprints(left: StackFingerprint, right: StackFingerprint) -> StackDiff:
+    """Locate the first divergent block, and its year when both kept per-year digests."""
+
+    if left.block_size != right.block_size:
+        raise ValueError("fingerprints must share a block size to be compared")
+    block, comparisons = first_divergent_block(left, right)
+    result = StackDiff(block=block, node_comparisons=comparisons)
+    if block is None or left.year_digests is None or right.year_digests is None:
+        return result
+
+    start = block * left.block_size
+    for index in range(start, start + left.block_size):
+        in_left = index < len(left)
+        in_right = index < len(right)
+        if not in_left and not in_right:
+            break
+        if in_left != in_right or left.year_digest(index) != right.year_digest(index):
+            result.index = index
+            return result
+    return result
+
+
+def _block_records(source: StackSource, fingerprint_: StackFingerprint, block: int) -> List[Record]:
+    """Re-read only the records of ``block`` (direct index or seek into the export)."""
+
+    start = block * fingerprint_.block_size
+    if isinstance(source, EpochStack):
+        stop = min(start + fingerprint_.block_size, len(source.epochs))
+        return [_stack_record(source, index) for index in range(start, stop)]
+    if block >= len(fingerprint_.block_starts):
+        return []
+    located = _iter_located_records(_export_parts(source), fingerprint_.block_starts[block])
+    return [record for _, record in islice(located, fingerprint_.block_size)]
+
+
+def diff_stacks(left: StackSource, right: StackSource, block_size: int = DEFAULT_BLOCK_SIZE) -> StackDiff:
+    """Find the first divergent year between two sources and name its changed fields.
+
+    Only block digests are held; the divergent block is then re-read from
+    each side (a seek for exports) to pinpoint the year and its fields.
+    """
+
+    left_print = fingerprint(left, block_size)
+    right_print = fingerprint(right, block_size)
+    result = diff_fingerprints(left_print, right_print)
+    if result.identical:
+        return result
+
+    left_block = _block_records(left, left_print, result.block)
+    right_block = _block_records(right, right_print, result.block)
+    for offset in range(max(len(left_block), len(right_block))):
+        left_record = left_block[offset] if offset < len(left_block) else None
+        right_record = right_block[offset] if offset < len(right_block) else None
+        result.index = result.block * block_size + offset
+        if left_record is None or right_record is None:
+            result.year = (left_record or right_record).get("year")
+            result.fields = ["<missing year>"]
+            return result
+        left_fields = field_digests(left_record)
+        right_fields = field_digests(right_record)
+        changed = [name for name in RECORD_FIELDS if left_fields[name] != right_fields[name]]
+        if changed:
+            result.year = left_record.get("year")
+            result.fields = changed
+            return result
+    # block digests differ but no record does: never report a false match
+    result.index = result.block * block_size
+    return result
+
+
+def _parse_source(text: str, years: int) -> StackSource:
+    if text.startswith("seed:"):
+        return generate_epoch_stack(seed=int(text[5:]), years=years)
+    return text
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Fingerprint, export and diff Codus-EPOCH stacks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write a seed's stack as JSON Lines.")
+    export.add_argument("seed", type=int)
+    export.add_argument("path")
+    export.add_argument("--years", type=int, default=100)
+
+    show = commands.add_parser("hash", help="Print the Merkle root of a stack.")
+    show.add_argument("source", help="'seed:<n>', a JSON Lines export or a directory of parts.")
+    show.add_argument("--years", type=int, default=100)
+    show.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+
+    diff = commands.add_parser("diff", help="Report the first divergent year and its changed fields.")
+    diff.add_argument("left", help="'seed:<n>', a JSON Lines export or a directory of parts.")
+    diff.add_argument("right", help="'seed:<n>', a JSON Lines export or a directory of parts.")
+    diff.add_argument("--years", type=int, default=100)
+    diff.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = build_parser().parse_args(list(argv) if argv is not None else None)
+
+    if args.command == "export":
+        count = export_stack(generate_epoch_stack(seed=args.seed, years=args.years), args.path)
+        print(f"Exported {count} years to {args.path}")
+        return 0
+
+    if args.command == "hash":
+        print(fingerprint(_parse_source(args.source, args.years), args.block_size).hexdigest())
+        return 0
+
+    result = diff_stacks(
+        _parse_source(args.left, args.years),
+        _parse_source(args.right, args.years),
+        block_size=args.block_size,
+    )
+    if result.identical:
+        print(f"identical ({result.node_comparisons} block comparisons)")
+        return 0
+    print(
+        f"first divergence at year {result.year} (index {result.index}, "
+        f"{result.node_comparisons} block comparisons): {', '.join(result.fields)}"
+    )
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
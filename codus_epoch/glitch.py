@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import random
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Sequence, Union
+
+from .lore import LoreTable
 
 
 GLITCH_GLYPHS: Sequence[str] = ("▓", "░", "█", "Ø", "Æ", "¿", "∴", "⌛", "✶", "¤")
@@ -34,11 +36,27 @@ class GlitchArtifact:
     annotation: str
 
 
-def _choose(seq: Sequence[str], rng: random.Random) -> str:
+Table = Union[Sequence[str], LoreTable]
+
+
+def _choose(seq: Table, rng: random.Random) -> str:
+    if isinstance(seq, LoreTable):
+        return seq.draw(rng)
     return rng.choice(seq)
 
 
-def inject_glitch(text: str, rng: random.Random, intensity: float = 0.12) -> str:
+def year_intensity(year: int) -> float:
+    """Default glitch intensity curve: late-century layers decay harder."""
+
+    return 0.18 if year > 70 else 0.1
+
+
+def inject_glitch(
+    text: str,
+    rng: random.Random,
+    intensity: float = 0.12,
+    glyphs: Table = GLITCH_GLYPHS,
+) -> str:
     """Insert symbolic glitches into the supplied text."""
 
     if not text:
@@ -49,27 +67,33 @@ def inject_glitch(text: str, rng: random.Random, intensity: float = 0.12) -> str
     positions = rng.sample(range(len(chars)), min(len(chars), glitch_count))
 
     for position in positions:
-        chars[position] = _choose(GLITCH_GLYPHS, rng)
+        chars[position] = _choose(glyphs, rng)
 
     return "".join(chars)
 
 
-def spawn_artifact(year: int, rng: random.Random) -> GlitchArtifact:
+def spawn_artifact(
+    year: int,
+    rng: random.Random,
+    prefixes: Table = PREFIXES,
+    suffixes: Table = SUFFIXES,
+    glyph_table: Table = GLITCH_GLYPHS,
+) -> GlitchArtifact:
     """Create a glitch banner describing the decay history."""
 
-    prefix = _choose(PREFIXES, rng)
-    suffix = _choose(SUFFIXES, rng)
-    glyphs = "".join(_choose(GLITCH_GLYPHS, rng) for _ in range(6))
+    prefix = _choose(prefixes, rng)
+    suffix = _choose(suffixes, rng)
+    glyphs = "".join(_choose(glyph_table, rng) for _ in range(6))
     banner = f"{prefix.upper()} {year:02d}".strip()
     annotation = f"{prefix} {suffix}."
     return GlitchArtifact(banner=banner, glyphs=glyphs, annotation=annotation)
 
 
-def echo_decay(notes: Iterable[str]) -> List[str]:
+def echo_decay(notes: Iterable[str], start: int = 1) -> List[str]:
     """Collapse a collection of notes into an annotated decay log."""
 
     collapsed: List[str] = []
-    for index, note in enumerate(notes, start=1):
+    for index, note in enumerate(notes, start=start):
         collapsed.append(f"Σ-decay[{index:02d}] :: {note}")
     return collapsed
 
@@ -80,4 +104,5 @@ __all__ = [
     "inject_glitch",
     "spawn_artifact",
     "echo_decay",
+    "year_intensity",
 ]
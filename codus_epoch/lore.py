@@ -0,0 +1,292 @@
+"""Lore tables and alias-method sampling for Codus-EPOCH corpora."""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+import hashlib
+import json
+import math
+import os
+import random
+from pathlib import Path
+from typing import Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+LoreEntry = Union[str, Tuple[str, ...]]
+
+CACHE_SUFFIX = ".lorecache"
+CACHE_VERSION = 2
+CACHE_MAGIC = b"LORECACHE"
+
+
+class AliasSampler:
+    """Walker/Vose alias table giving O(1) weighted index draws."""
+
+    __slots__ = ("size", "prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        size = len(weights)
+        if size == 0:
+            raise ValueError("alias sampler needs at least one weight")
+        if any(not math.isfinite(weight) or weight < 0 for weight in weights):
+            raise ValueError("alias weights must be finite and non-negative")
+        total = float(sum(weights))
+        if not math.isfinite(total) or total <= 0:
+            raise ValueError("alias weights must have a finite positive sum")
+
+        scaled = [weight * size / total for weight in weights]
+        prob = array("d", [1.0]) * size
+        alias = array("I", range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # leftovers are 1.0 up to float error; prob/alias already default to self
+
+        self.size = size
+        self.prob = prob
+        self.alias = alias
+
+    @classmethod
+    def from_arrays(cls, prob: array, alias: array) -> "AliasSampler":
+        sampler = cls.__new__(cls)
+        sampler.size = len(prob)
+        sampler.prob = prob
+        sampler.alias = alias
+        return sampler
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw one index using a single ``rng.random()`` call."""
+
+        scaled = rng.random() * self.size
+        # float rounding can land exactly on size for very large tables
+        column = min(int(scaled), self.size - 1)
+        if scaled - column < self.prob[column]:
+            return column
+        return self.alias[column]
+
+
+@dataclass
+class LoreTable(Generic[T]):
+    """Drawable lore corpus; weighted tables compile to an alias sampler.
+
+    Unweighted tables draw with ``rng.choice`` so they consume the RNG exactly
+    like the built-in tuples and keep existing seeds reproducible.
+    """
+
+    entries: Sequence[T]
+    weights: Optional[Sequence[float]] = None
+    sampler: Optional[AliasSampler] = None
+    _columns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.weights is not None:
+            if len(self.weights) != len(self.entries):
+                raise ValueError("lore weights must align with entries")
+            if self.sampler is None:
+                self.sampler = AliasSampler(self.weights)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def weighted(self) -> bool:
+        return self.sampler is not None
+
+    @property
+    def columns(self) -> int:
+        """Entry width: 1 for plain text, n for n-tuples, -1 when rows differ.
+
+        Computed on first use and remembered, so a loaded table is walked
+        once however many stacks it generates.
+        """
+
+        if self._columns is None:
+            self._columns = _entry_columns(self.entries)
+        return self._columns
+
+    def draw(self, rng: random.Random) -> T:
+        if self.sampler is None:
+            return rng.choice(self.entries)
+        return self.entries[self.sampler.sample(rng)]
+
+
+def _entry_columns(entries: Sequence[object]) -> int:
+    widths = {len(entry) if isinstance(entry, tuple) else 1 if isinstance(entry, str) else -1 for entry in entries}
+    return widths.pop() if len(widths) == 1 else -1
+
+
+def as_table(source: Union[LoreTable, Sequence[T]]) -> LoreTable:
+    """Wrap a plain sequence as an unweighted table (tables pass through)."""
+
+    if isinstance(source, LoreTable):
+        return source
+    return LoreTable(entries=source)
+
+
+def _parse_entry(columns: List[str]) -> LoreEntry:
+    return columns[0] if len(columns) == 1 else tuple(columns)
+
+
+def _is_weight(text: str) -> bool:
+    try:
+        return math.isfinite(float(text))
+    except ValueError:
+        return False
+
+
+def parse_lore_lines(lines: Sequence[str], weighted: Optional[bool] = None) -> LoreTable:
+    """Parse tab-separated lore lines; ``#`` comments and blanks are skipped.
+
+    When weighted, the first column of every line is the entry weight. Any
+    remaining columns form the entry (a tuple when more than one). With
+    ``weighted=None`` the layout is detected: the table is weighted when every
+    line has at least two columns and a numeric first column.
+    """
+
+    rows = [line.rstrip("\r\n").split("\t") for line in lines]
+    rows = [row for row in rows if row[0].strip() and not row[0].lstrip().startswith("#")]
+    if not rows:
+        raise ValueError("lore table is empty")
+
+    if weighted is None:
+        weighted = all(len(row) > 1 and _is_weight(row[0]) for row in rows)
+
+    if not weighted:
+        return LoreTable(entries=[_parse_entry(row) for row in rows])
+
+    entries: List[LoreEntry] = []
+    weights: List[float] = []
+    for number, row in enumerate(rows, start=1):
+        if len(row) < 2 or not _is_weight(row[0]):
+            raise ValueError(f"lore row {number} is missing a numeric weight column")
+        weights.append(float(row[0]))
+        entries.append(_parse_entry(row[1:]))
+    return LoreTable(entries=entries, weights=weights)
+
+
+def _cache_key(path: Path, weighted: Optional[bool]) -> str:
+    stat = path.stat()
+    raw = f"{CACHE_VERSION}:{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{weighted}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _read_cache(cache_path: Path, key: str) -> Optional[LoreTable]:
+    """Load a cache written by :func:`_write_cache`; any mismatch means rebuild.
+
+    The format is plain data only (a JSON header and entry list followed by
+    raw ``array`` buffers), so a stray cache file cannot execute code.
+    """
+
+    try:
+        with cache_path.open("rb") as handle:
+            if handle.readline().rstrip(b"\n") != CACHE_MAGIC:
+                return None
+            header = json.loads(handle.readline())
+            if not isinstance(header, dict) or header.get("key") != key:
+                return None
+            size = header["size"]
+            weighted = header["weighted"]
+            if not isinstance(size, int) or size < 1 or array("I").itemsize != header["alias_itemsize"]:
+                return None
+            entries = json.loads(handle.read(header["entries_bytes"]))
+            if not isinstance(entries, list) or len(entries) != size:
+                return None
+            entries = [tuple(entry) if isinstance(entry, list) else entry for entry in entries]
+            if not weighted:
+                return LoreTable(entries=entries)
+            weights, prob, alias = array("d"), array("d"), array("I")
+            weights.fromfile(handle, size)
+            prob.fromfile(handle, size)
+            alias.fromfile(handle, size)
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+    if max(alias) >= size:
+        return None
+    return LoreTable(entries=entries, weights=weights, sampler=AliasSampler.from_arrays(prob, alias))
+
+
+def _write_cache(cache_path: Path, key: str, table: LoreTable) -> None:
+    entries = json.dumps(list(table.entries), ensure_ascii=False).encode("utf-8")
+    header = {
+        "key": key,
+        "size": len(table.entries),
+        "weighted": table.sampler is not None,
+        "entries_bytes": len(entries),
+        "alias_itemsize": array("I").itemsize,
+    }
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(CACHE_MAGIC + b"\n")
+            handle.write(json.dumps(header).encode("utf-8") + b"\n")
+            handle.write(entries)
+            if table.sampler is not None:
+                array("d", table.weights).tofile(handle)
+                table.sampler.prob.tofile(handle)
+                table.sampler.alias.tofile(handle)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # a read-only corpus directory simply means no cache
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_lore_table(
+    path: Union[str, os.PathLike],
+    weighted: Optional[bool] = None,
+    cache_dir: Union[str, os.PathLike, None] = None,
+    use_cache: bool = True,
+) -> LoreTable:
+    """Load a lore corpus from disk, reusing a compiled alias cache if fresh.
+
+    The cache lives next to the corpus (``<name>.lorecache``) unless
+    ``cache_dir`` is given, and is invalidated when the source changes.
+    """
+
+    source = Path(path)
+    cache_path = Path(cache_dir) / (source.name + CACHE_SUFFIX) if cache_dir else source.with_name(source.name + CACHE_SUFFIX)
+    key = _cache_key(source, weighted)
+
+    if use_cache:
+        cached = _read_cache(cache_path, key)
+        if cached is not None:
+            return cached
+
+    with source.open("r", encoding="utf-8") as handle:
+        table = parse_lore_lines(handle.readlines(), weighted=weighted)
+
+    if use_cache:
+        if cache_dir:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_cache(cache_path, key, table)
+    return table
+
+
+def load_lore_tables(
+    directory: Union[str, os.PathLike],
+    cache_dir: Union[str, os.PathLike, None] = None,
+    use_cache: bool = True,
+) -> Dict[str, LoreTable]:
+    """Load every ``*.tsv`` corpus in a directory keyed by file stem."""
+
+    return {
+        path.stem: load_lore_table(path, cache_dir=cache_dir, use_cache=use_cache)
+        for path in sorted(Path(directory).glob("*.tsv"))
+    }
+
+
+__all__ = [
+    "AliasSampler",
+    "LoreTable",
+    "as_table",
+    "parse_lore_lines",
+    "load_lore_table",
+    "load_lore_tables",
+]
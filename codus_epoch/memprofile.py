@@ -0,0 +1,325 @@
+"""tracemalloc-based memory profiling for the generator and the viewer.
+
+Used by ``main.py --profile-memory``. Reports attribute retained bytes and
+allocation counts to modules and functions, bytes per epoch for the
+generator, and growth across rendered frames for the viewer (a steadily
+growing viewer between frames points at a leak).
+
+SDL pixel buffers live outside the Python allocator, so tracemalloc never
+sees them; the viewer report counts explicit ``pygame.Surface`` creations
+and their pixel bytes separately.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import fnmatch
+import gc
+import json
+import linecache
+import os
+import re
+import tracemalloc
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .epochs import generate_epoch_stack
+
+DEF_PATTERN = re.compile(r"^(\s*)(?:async\s+)?def\s+(\w+)")
+
+
+@dataclass
+class SiteStat:
+    """Bytes and allocation blocks attributed to one module or function."""
+
+    name: str
+    bytes: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    target: str
+    total_bytes: int = 0
+    total_blocks: int = 0
+    peak_bytes: int = 0
+    by_module: List[SiteStat] = field(default_factory=list)
+    by_function: List[SiteStat] = field(default_factory=list)
+    object_counts: Dict[str, int] = field(default_factory=dict)
+    bytes_per_epoch: Optional[float] = None
+    frames: Optional[int] = None
+    growth_per_frame: Optional[float] = None
+    growth_samples: List[Tuple[int, int]] = field(default_factory=list)
+    surfaces_created: Optional[int] = None
+    surface_bytes: Optional[int] = None
+    note: str = ""
+
+
+def _enclosing_function(filename: str, lineno: int) -> str:
+    """Name of the ``def`` enclosing ``filename:lineno`` (module level otherwise)."""
+
+    line = linecache.getline(filename, lineno)
+    match = DEF_PATTERN.match(line)
+    if match:
+        return match.group(2)
+    # walk outwards: each strictly less-indented line is an enclosing block
+    threshold = len(line) - len(line.lstrip())
+    for number in range(lineno - 1, 0, -1):
+        text = linecache.getline(filename, number)
+        if not text.strip():
+            continue
+        indent = len(text) - len(text.lstrip())
+        # a dedented ")" closes a multi-line signature or call, not a block
+        if indent < threshold and not text.lstrip().startswith((")", "]", "}")):
+            match = DEF_PATTERN.match(text)
+            if match:
+                return match.group(2)
+            threshold = indent
+    return "<module>"
+
+
+def _module_name(filename: str) -> str:
+    parts = os.path.normpath(filename).split(os.sep)
+    if "codus_epoch" in parts:
+        return ".".join(parts[parts.index("codus_epoch"):])[: -len(".py")]
+    return os.path.basename(filename)
+
+
+def _attribute(stats: Sequence[tracemalloc.StatisticDiff], top: int) -> Tuple[List[SiteStat], List[SiteStat]]:
+    """Fold line-level diffs into module/function totals (self allocations, not cumulative)."""
+
+    modules: Dict[str, List[int]] = {}
+    functions: Dict[str, List[int]] = {}
+    for stat in stats:
+        frame = stat.traceback[0]
+        module = _module_name(frame.filename)
+        function = f"{module}:{_enclosing_function(frame.filename, frame.lineno)}"
+        for bucket, key in ((modules, module), (functions, function)):
+            totals = bucket.setdefault(key, [0, 0])
+            totals[0] += stat.size_diff
+            totals[1] += stat.count_diff
+
+    def ranked(bucket: Dict[str, List[int]]) -> List[SiteStat]:
+        rows = [SiteStat(name=name, bytes=size, count=count) for name, (size, count) in bucket.items()]
+        rows.sort(key=lambda row: abs(row.bytes), reverse=True)
+        return rows[:top]
+
+    return ranked(modules), ranked(functions)
+
+
+def _object_counts() -> Dict[str, int]:
+    # a plain str -> int dict is not gc-tracked, so it never counts itself,
+    # and filling it here keeps its allocations inside the filtered module
+    counts: Dict[str, int] = {}
+    for item in gc.get_objects():
+        name = type(item).__name__
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def _new_objects(before: Dict[str, int], after: Dict[str, int], top: int) -> Dict[str, int]:
+    return dict((Counter(after) - Counter(before)).most_common(top))
+
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+)
+
+
+def _start_tracing() -> None:
+    # compile the filter patterns before tracing so their cache is not reported
+    for item in SNAPSHOT_FILTERS:
+        fnmatch.fnmatch(__file__, item.filename_pattern)
+    tracemalloc.start()
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Snapshot without the profiler's own allocations (this module, tracemalloc, linecache)."""
+
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+
+def profile_generator(seed: int = 2084, years: int = 100, top: int = 15) -> MemoryReport:
+    """Measure what one retained stack costs, per module, function and epoch."""
+
+    generate_epoch_stack(seed=seed, years=1)  # import-time and lore setup outside the window
+    gc.collect()
+    _start_tracing()
+    try:
+        # counted between the snapshots so neither snapshot shows up as new objects
+        before = _snapshot()
+        objects_before = _object_counts()
+        tracemalloc.reset_peak()
+        stack = generate_epoch_stack(seed=seed, years=years)
+        _, peak = tracemalloc.get_traced_memory()
+        objects_after = _object_counts()
+        after = _snapshot()
+    finally:
+        tracemalloc.stop()
+
+    diff = after.compare_to(before, "lineno")
+    by_module, by_function = _attribute(diff, top)
+    total = sum(stat.size_diff for stat in diff)
+    report = MemoryReport(
+        target="generator",
+        total_bytes=total,
+        total_blocks=sum(stat.count_diff for stat in diff),
+        peak_bytes=peak,
+        by_module=by_module,
+        by_function=by_function,
+        object_counts=_new_objects(objects_before, objects_after, top),
+        bytes_per_epoch=total / years if years else None,
+    )
+    del stack
+    return report
+
+
+@contextmanager
+def _count_surfaces() -> Iterator[List[int]]:
+    """Tally ``[count, pixel bytes]`` of ``pygame.Surface(...)`` calls made meanwhile.
+
+    Surfaces returned by ``Font.render`` are created inside SDL and are not
+    counted.
+    """
+
+    import pygame
+
+    original = pygame.Surface
+    tally = [0, 0]
+
+    class CountedSurface(original):  # type: ignore[misc, valid-type]
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            tally[0] += 1
+            tally[1] += self.get_bytesize() * self.get_width() * self.get_height()
+
+    pygame.Surface = CountedSurface
+    try:
+        yield tally
+    finally:
+        pygame.Surface = original
+
+
+def profile_viewer(seed: int = 2084, frames: int = 300, top: int = 15, samples: int = 6) -> MemoryReport:
+    """Render ``frames`` headless frames while scrolling and report growth.
+
+    The first frames warm font and glyph caches; growth is measured from a
+    snapshot taken after warm-up, so retained bytes here are candidates for
+    leaks rather than one-off setup. Surface pixel buffers are SDL memory
+    and are reported as ``surfaces_created``/``surface_bytes`` instead.
+    """
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        from .pygame_app import LINE_HEIGHT, EpochViewer
+    except ImportError as exc:
+        return MemoryReport(target="viewer", note=f"skipped: {exc}")
+
+    viewer = EpochViewer(generate_epoch_stack(seed=seed))
+    span = len(viewer.stack.epochs) * LINE_HEIGHT
+
+    def render(frame: int) -> None:
+        viewer.target_offset = (frame * LINE_HEIGHT / 4) % span
+        viewer._update(1 / 60)
+        viewer._draw()
+
+    every = max(1, frames // max(1, samples))
+    # sized up front so sampling does not grow a list inside the measured window
+    growth_samples = [(frame, 0) for frame in range(1, frames + 1) if frame % every == 0 or frame == frames]
+    sample_slot = {frame: slot for slot, (frame, _) in enumerate(growth_samples)}
+    with _count_surfaces() as surfaces:
+        for frame in range(10):
+            render(frame)
+        surfaces[:] = [0, 0]
+        gc.collect()
+        _start_tracing()
+        try:
+            before = _snapshot()
+            objects_before = _object_counts()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            for frame in range(1, frames + 1):
+                render(frame)
+                if frame in sample_slot:
+                    gc.collect()  # sample what survives, not garbage awaiting collection
+                    growth_samples[sample_slot[frame]] = (frame, tracemalloc.get_traced_memory()[0] - base)
+            gc.collect()
+            _, peak = tracemalloc.get_traced_memory()
+            objects_after = _object_counts()
+            after = _snapshot()
+        finally:
+            tracemalloc.stop()
+
+    diff = after.compare_to(before, "lineno")
+    by_module, by_function = _attribute(diff, top)
+    total = sum(stat.size_diff for stat in diff)
+    return MemoryReport(
+        target="viewer",
+        total_bytes=total,
+        total_blocks=sum(stat.count_diff for stat in diff),
+        peak_bytes=peak,
+        by_module=by_module,
+        by_function=by_function,
+        object_counts=_new_objects(objects_before, objects_after, top),
+        frames=frames,
+        growth_per_frame=_growth_slope(growth_samples),
+        growth_samples=growth_samples,
+        surfaces_created=surfaces[0],
+        surface_bytes=surfaces[1],
+    )
+
+
+def _growth_slope(samples: Sequence[Tuple[int, int]]) -> Optional[float]:
+    """Bytes per frame between the first and last sample (skips first-interval warm-up)."""
+
+    if len(samples) < 2:
+        return None
+    (first_frame, first_size), (last_frame, last_size) = samples[0], samples[-1]
+    return (last_size - first_size) / (last_frame - first_frame)
+
+
+def format_report(report: MemoryReport) -> str:
+    lines = [f"== memory profile: {report.target} =="]
+    if report.note:
+        lines.append(report.note)
+        return "\n".join(lines)
+    lines.append(
+        f"retained {report.total_bytes} B in {report.total_blocks} blocks, peak {report.peak_bytes} B"
+    )
+    if report.bytes_per_epoch is not None:
+        lines.append(f"bytes per epoch: {report.bytes_per_epoch:.1f}")
+    if report.growth_per_frame is not None:
+        lines.append(f"growth over {report.frames} frames: {report.growth_per_frame:.1f} B/frame after warm-up")
+        lines.append("  " + ", ".join(f"f{frame}:{size:+d}B" for frame, size in report.growth_samples))
+    if report.surfaces_created is not None:
+        lines.append(
+            f"pygame.Surface: {report.surfaces_created} created, {report.surface_bytes} B of SDL pixels "
+            "(outside tracemalloc; font-rendered surfaces not counted)"
+        )
+    for title, rows in (("by module", report.by_module), ("by function", report.by_function)):
+        lines.append(f"-- {title}")
+        lines.extend(f"  {row.bytes:>10} B {row.count:>8} blocks  {row.name}" for row in rows)
+    if report.object_counts:
+        lines.append("-- new objects by type (gc-tracked)")
+        lines.extend(f"  {count:>8}  {name}" for name, count in report.object_counts.items())
+    return "\n".join(lines)
+
+
+def render_reports(reports: Sequence[MemoryReport], fmt: str = "text") -> str:
+    if fmt == "json":
+        return json.dumps([asdict(report) for report in reports], indent=2)
+    return "\n\n".join(format_report(report) for report in reports)
+
+
+__all__ = [
+    "MemoryReport",
+    "SiteStat",
+    "profile_generator",
+    "profile_viewer",
+    "format_report",
+    "render_reports",
+]
@@ -0,0 +1,281 @@
+"""Property checks for generated stacks across large seed ranges.
+
+The seed space is split into chunks that run on a process pool; every
+violation is reported with the smallest horizon (``years``) that still
+reproduces it. Run ``python -m codus_epoch.properties --count 1000000``.
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+import json
+import os
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .epochs import INITIAL_STATUS, INITIAL_UPGRADE, EpochStack, generate_epoch_stack
+from .fingerprint import fingerprint
+from .glitch import GLITCH_GLYPHS, year_intensity
+
+
+@dataclass
+class Violation:
+    """One failed invariant for one seed; ``year`` is None for stack-wide checks."""
+
+    invariant: str
+    seed: int
+    year: Optional[int]
+    detail: str
+    repro_years: Optional[int] = None
+
+    @property
+    def repro(self) -> str:
+        years = self.repro_years if self.repro_years is not None else "..."
+        return f"generate_epoch_stack(seed={self.seed}, years={years})"
+
+
+Check = Callable[[EpochStack], Iterator[Tuple[Optional[int], str]]]
+
+
+def _check_glitch_glyphs(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    for epoch in stack.epochs:
+        if not any(glyph in epoch.glitch_trace for glyph in GLITCH_GLYPHS):
+            yield epoch.year, "glitch_trace carries no glitch glyph"
+
+
+def _check_regret_log(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    for epoch in stack.epochs:
+        if len(epoch.regret_log) < 2:
+            yield epoch.year, f"regret_log has {len(epoch.regret_log)} entries"
+
+
+def _check_lore_fields(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    for epoch in stack.epochs:
+        missing = [
+            name
+            for name, value in (
+                ("glitch_banner", epoch.glitch_banner),
+                ("patch_lore", epoch.patch_lore),
+                ("patch_fragment", epoch.patch_fragment),
+                ("regret_anchor", epoch.regret_anchor),
+            )
+            if not value
+        ]
+        if missing:
+            yield epoch.year, f"empty {', '.join(missing)}"
+
+
+def _check_logline_chain(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    last_upgrade, last_status = INITIAL_UPGRADE, INITIAL_STATUS
+    for epoch in stack.epochs:
+        expected = f"After {last_upgrade}, the council doubted the {last_status} promise."
+        if expected not in epoch.logline or f"We {epoch.upgrade} " not in epoch.logline:
+            yield epoch.year, "logline does not chain from the previous upgrade/status"
+        last_upgrade, last_status = epoch.upgrade, epoch.status
+
+
+def _check_glitch_intensity(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    for epoch in stack.epochs:
+        if len(epoch.glitch_trace) != len(epoch.logline):
+            yield epoch.year, "glitch_trace length differs from logline"
+            continue
+        changed = sum(1 for a, b in zip(epoch.logline, epoch.glitch_trace) if a != b)
+        expected = max(1, int(len(epoch.logline) * year_intensity(epoch.year)))
+        if changed != expected:
+            yield epoch.year, f"{changed} glitched chars, expected {expected}"
+
+
+def _check_timeline_shape(stack: EpochStack) -> Iterator[Tuple[Optional[int], str]]:
+    for index, epoch in enumerate(stack.epochs):
+        if epoch.year != index + 1 or epoch.decade != index // 10:
+            yield epoch.year, f"year/decade {epoch.year}/{epoch.decade} at position {index}"
+    count = len(stack.epochs)
+    if not len(stack.echoes) == len(stack.reflections) == len(stack.decay_logs) == count:
+        yield None, "echo/reflection/decay lengths do not match epochs"
+
+
+INVARIANTS: Dict[str, Check] = {
+    "glitch_glyphs": _check_glitch_glyphs,
+    "regret_log": _check_regret_log,
+    "lore_fields": _check_lore_fields,
+    "logline_chain": _check_logline_chain,
+    "glitch_intensity": _check_glitch_intensity,
+    "timeline_shape": _check_timeline_shape,
+}
+
+
+def check_stack(
+    stack: EpochStack,
+    seed: int,
+    invariants: Sequence[str] = tuple(INVARIANTS),
+) -> List[Violation]:
+    """Run the named invariants, keeping the first violation of each."""
+
+    found: List[Violation] = []
+    for name in invariants:
+        for year, detail in INVARIANTS[name](stack):
+            found.append(Violation(invariant=name, seed=seed, year=year, detail=detail))
+            break
+    return found
+
+
+def minimise(violation: Violation, years: int, invariants: Sequence[str]) -> Violation:
+    """Record the shortest horizon that still reproduces ``violation``.
+
+    Shorter horizons are prefixes of longer ones for the same seed, so a
+    per-year violation reproduces at ``years=violation.year``; that is
+    confirmed before it is reported.
+    """
+
+    candidate = violation.year if violation.year is not None else years
+    stack = generate_epoch_stack(seed=violation.seed, years=candidate)
+    if any(found.invariant == violation.invariant for found in check_stack(stack, violation.seed, invariants)):
+        violation.repro_years = candidate
+    else:
+        violation.repro_years = years
+    return violation
+
+
+def check_range(
+    start: int,
+    stop: int,
+    years: int = 100,
+    invariants: Sequence[str] = tuple(INVARIANTS),
+    determinism: bool = False,
+) -> Tuple[int, List[Violation]]:
+    """Check every seed in ``[start, stop)``; returns (seeds checked, violations)."""
+
+    violations: List[Violation] = []
+    for seed in range(start, stop):
+        stack = generate_epoch_stack(seed=seed, years=years)
+        found = check_stack(stack, seed, invariants)
+        if determinism:
+            again = generate_epoch_stack(seed=seed, years=years)
+            if fingerprint(again).root != fingerprint(stack).root:
+                found.append(Violation("determinism", seed, None, "regenerated stack differs"))
+        violations.extend(minimise(violation, years, invariants) for violation in found)
+    return stop - start, violations
+
+
+@dataclass
+class PropertyReport:
+    start: int
+    stop: int
+    checked: int = 0
+    seconds: float = 0.0
+    violations: List[Violation] = field(default_factory=list)
+
+    @property
+    def seeds_per_second(self) -> float:
+        return self.checked / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "stop": self.stop,
+            "checked": self.checked,
+            "seconds": self.seconds,
+            "seeds_per_second": self.seeds_per_second,
+            "violations": [dict(asdict(item), repro=item.repro) for item in self.violations],
+        }
+
+
+def run_properties(
+    start: int,
+    count: int,
+    years: int = 100,
+    workers: Optional[int] = None,
+    chunk: int = 500,
+    invariants: Sequence[str] = tuple(INVARIANTS),
+    determinism: bool = False,
+    max_failures: int = 50,
+) -> PropertyReport:
+    """Shard ``[start, start + count)`` across worker processes.
+
+    ``workers=1`` runs in-process, which keeps tracebacks readable when
+    debugging an invariant.
+    """
+
+    unknown = set(invariants) - set(INVARIANTS)
+    if unknown:
+        raise KeyError(f"unknown invariants: {', '.join(sorted(unknown))}")
+    stop = start + count
+    report = PropertyReport(start=start, stop=stop)
+    shards = [(low, min(low + chunk, stop)) for low in range(start, stop, chunk)]
+    began = time.perf_counter()
+
+    if (workers or os.cpu_count() or 1) == 1:
+        for low, high in shards:
+            checked, found = check_range(low, high, years, invariants, determinism)
+            report.checked += checked
+            report.violations.extend(found)
+            if len(report.violations) >= max_failures:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = [pool.submit(check_range, low, high, years, tuple(invariants), determinism) for low, high in shards]
+            for future in as_completed(pending):
+                checked, found = future.result()
+                report.checked += checked
+                report.violations.extend(found)
+                if len(report.violations) >= max_failures:
+                    for other in pending:
+                        other.cancel()
+                    break
+
+    report.seconds = time.perf_counter() - began
+    report.violations.sort(key=lambda item: (item.seed, item.invariant))
+    return report
+
+
+def format_report(report: PropertyReport) -> str:
+    lines = [
+        f"checked {report.checked} seeds in [{report.start}, {report.stop}) "
+        f"in {report.seconds:.2f}s ({report.seeds_per_second:.1f} seeds/s)"
+    ]
+    if not report.violations:
+        lines.append("all invariants held")
+    for item in report.violations:
+        where = f"year {item.year}" if item.year is not None else "stack"
+        lines.append(f"FAIL {item.invariant} seed={item.seed} {where}: {item.detail} -> {item.repro}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Check stack invariants across a seed range.")
+    parser.add_argument("--start", type=int, default=0, help="First seed to check.")
+    parser.add_argument("--count", type=int, default=10_000, help="Number of consecutive seeds.")
+    parser.add_argument("--years", type=int, default=100, help="Horizon generated per seed.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--chunk", type=int, default=500, help="Seeds per shard.")
+    parser.add_argument(
+        "--invariant",
+        action="append",
+        choices=sorted(INVARIANTS),
+        help="Limit to the named invariant (repeatable).",
+    )
+    parser.add_argument("--determinism", action="store_true", help="Regenerate each seed and compare fingerprints.")
+    parser.add_argument("--max-failures", type=int, default=50, help="Stop after this many violations.")
+    parser.add_argument("--json", action="store_true", help="Emit the report as JSON.")
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = build_parser().parse_args(list(argv) if argv is not None else None)
+    report = run_properties(
+        start=args.start,
+        count=args.count,
+        years=args.years,
+        workers=args.workers,
+        chunk=args.chunk,
+        invariants=tuple(args.invariant or INVARIANTS),
+        determinism=args.determinism,
+        max_failures=args.max_failures,
+    )
+    print(json.dumps(report.to_dict(), indent=2) if args.json else format_report(report))
+    return 1 if report.violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,269 @@
+"""Sharded generation of one long timeline across worker processes.
+
+The horizon is cut into fixed blocks of ``shard_years``. Each block draws
+from its own RNG stream derived from ``(seed, block)``, so the result does
+not depend on how many workers run it. The only cross-block dependency is
+the previous year's upgrade/status in each logline; the last year of every
+block pins those two values from a separate "tail" stream, which the next
+block can recompute without waiting for its predecessor.
+
+Sharded output is a different (but reproducible) timeline from
+``generate_epoch_stack(seed)``; it is keyed by ``seed`` and ``shard_years``.
+
+Lore tables are resolved once and handed to each worker process through the
+pool initializer rather than with every block. ``glitch_intensity`` still
+travels with each task, so with ``workers != 1`` it must be picklable (a
+module-level function, not a lambda or closure).
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .epochs import INITIAL_STATUS, INITIAL_UPGRADE, EpochStack, generate_epoch_range, resolve_lore
+from .fingerprint import MANIFEST_NAME, iter_stack_records, write_records
+from .glitch import year_intensity
+from .lore import LoreTable
+
+DEFAULT_SHARD_YEARS = 10_000
+PART_PATTERN = "part-{index:0{width}d}.jsonl"
+PART_WIDTH = 5
+
+LoreSource = Optional[Mapping[str, Union[Sequence, LoreTable]]]
+Tables = Dict[str, LoreTable]
+
+# resolved lore tables of a worker process, set once by _init_worker
+_worker_tables: Optional[Tables] = None
+
+
+def derive_seed(seed: int, *labels: object) -> int:
+    """Stable 64-bit seed for a labelled sub-stream (independent of PYTHONHASHSEED)."""
+
+    raw = ":".join(str(part) for part in (seed, *labels)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big")
+
+
+def block_tail(seed: int, block: int, tables: Mapping[str, LoreTable]) -> Tuple[str, str]:
+    """The pinned (upgrade, status) of the last year of ``block``."""
+
+    rng = random.Random(derive_seed(seed, "tail", block))
+    return tables["upgrades"].draw(rng), tables["statuses"].draw(rng)
+
+
+def generate_shard(
+    seed: int,
+    block: int,
+    years: int,
+    shard_years: int = DEFAULT_SHARD_YEARS,
+    lore: LoreSource = None,
+    glitch_intensity: Callable[[int], float] = year_intensity,
+) -> EpochStack:
+    """Generate block ``block`` of a ``years``-long sharded timeline."""
+
+    return _generate_block(seed, block, years, shard_years, resolve_lore(lore), glitch_intensity)
+
+
+def _generate_block(
+    seed: int,
+    block: int,
+    years: int,
+    shard_years: int,
+    tables: Tables,
+    glitch_intensity: Callable[[int], float],
+) -> EpochStack:
+    first_year = block * shard_years + 1
+    block_end = first_year + shard_years - 1
+    last_year = min(block_end, years)
+
+    if block == 0:
+        last_upgrade, last_status = INITIAL_UPGRADE, INITIAL_STATUS
+    else:
+        last_upgrade, last_status = block_tail(seed, block - 1, tables)
+    # only a full block ends on its pinned tail year, keeping shorter horizons prefixes
+    pinned = {block_end: block_tail(seed, block, tables)} if last_year == block_end else None
+
+    return generate_epoch_range(
+        random.Random(derive_seed(seed, "block", block)),
+        tables,
+        first_year=first_year,
+        last_year=last_year,
+        last_upgrade=last_upgrade,
+        last_status=last_status,
+        glitch_intensity=glitch_intensity,
+        pinned=pinned,
+    )
+
+
+def _block_count(years: int, shard_years: int) -> int:
+    if shard_years < 1:
+        raise ValueError("shard_years must be positive")
+    return (years + shard_years - 1) // shard_years
+
+
+def _part_name(block: int, blocks: int) -> str:
+    return PART_PATTERN.format(index=block, width=max(PART_WIDTH, len(str(blocks - 1))))
+
+
+def _init_worker(tables: Optional[Tables]) -> None:
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _worker_shard(
+    seed: int,
+    block: int,
+    years: int,
+    shard_years: int,
+    glitch_intensity: Callable[[int], float],
+) -> EpochStack:
+    return _generate_block(seed, block, years, shard_years, _worker_tables, glitch_intensity)
+
+
+def _write_shard(
+    seed: int,
+    block: int,
+    years: int,
+    shard_years: int,
+    path: str,
+    glitch_intensity: Callable[[int], float],
+) -> Tuple[str, int]:
+    stack = _worker_shard(seed, block, years, shard_years, glitch_intensity)
+    return path, write_records(iter_stack_records(stack), path)
+
+
+def _check_picklable(glitch_intensity: Callable[[int], float]) -> None:
+    try:
+        pickle.dumps(glitch_intensity)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        raise ValueError(
+            "glitch_intensity must be a picklable module-level function when workers != 1 "
+            f"(lambdas and closures are not): {exc}"
+        ) from exc
+
+
+def _run_blocks(
+    task: Callable[..., object],
+    args: Sequence[tuple],
+    tables: Tables,
+    workers: Optional[int],
+    glitch_intensity: Callable[[int], float],
+) -> list:
+    if workers == 1:
+        _init_worker(tables)
+        try:
+            return [task(*item) for item in args]
+        finally:
+            _init_worker(None)
+    _check_picklable(glitch_intensity)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as pool:
+        return [future.result() for future in [pool.submit(task, *item) for item in args]]
+
+
+def generate_sharded_stack(
+    seed: int = 2084,
+    years: int = 100,
+    shard_years: int = DEFAULT_SHARD_YEARS,
+    workers: Optional[int] = None,
+    lore: LoreSource = None,
+    glitch_intensity: Callable[[int], float] = year_intensity,
+) -> EpochStack:
+    """Generate all blocks concurrently and concatenate them in year order.
+
+    Returned shards are pickled back to this process; for very long
+    horizons :func:`write_sharded_stack` scales better.
+    """
+
+    args = [
+        (seed, block, years, shard_years, glitch_intensity)
+        for block in range(_block_count(years, shard_years))
+    ]
+    shards = _run_blocks(_worker_shard, args, resolve_lore(lore), workers, glitch_intensity)
+
+    stack = EpochStack(epochs=[], echoes=[], reflections=[], decay_logs=[])
+    for shard in shards:
+        stack.epochs.extend(shard.epochs)
+        stack.echoes.extend(shard.echoes)
+        stack.reflections.extend(shard.reflections)
+        stack.decay_logs.extend(shard.decay_logs)
+    return stack
+
+
+def write_sharded_stack(
+    directory: Union[str, "os.PathLike[str]"],
+    seed: int = 2084,
+    years: int = 100,
+    shard_years: int = DEFAULT_SHARD_YEARS,
+    workers: Optional[int] = None,
+    lore: LoreSource = None,
+    glitch_intensity: Callable[[int], float] = year_intensity,
+) -> List[Path]:
+    """Have each worker write its block straight to ``part-NNNNN.jsonl``.
+
+    Parts and the manifest from an earlier run are removed first. The
+    ``manifest.json`` written last lists the parts in year order, and the
+    directory reads back as one export through
+    :func:`codus_epoch.fingerprint.iter_export_records`.
+    """
+
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in [target / MANIFEST_NAME, *target.glob("part-*.jsonl")]:
+        stale.unlink(missing_ok=True)
+
+    blocks = _block_count(years, shard_years)
+    names = [_part_name(block, blocks) for block in range(blocks)]
+    args = [
+        (seed, block, years, shard_years, str(target / name), glitch_intensity)
+        for block, name in enumerate(names)
+    ]
+    written = _run_blocks(_write_shard, args, resolve_lore(lore), workers, glitch_intensity)
+
+    manifest = {
+        "seed": seed,
+        "years": years,
+        "shard_years": shard_years,
+        "part_count": blocks,
+        "parts": names,
+        "records": [count for _, count in written],
+    }
+    with open(target / MANIFEST_NAME, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+        handle.write("\n")
+    return [Path(path) for path, _ in written]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate one long timeline in parallel shards.")
+    parser.add_argument("directory", help="Output directory for part-NNNNN.jsonl files and manifest.json (earlier parts are replaced).")
+    parser.add_argument("--seed", type=int, default=2084)
+    parser.add_argument("--years", type=int, default=1_000_000)
+    parser.add_argument("--shard-years", type=int, default=DEFAULT_SHARD_YEARS)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = build_parser().parse_args(list(argv) if argv is not None else None)
+    began = time.perf_counter()
+    parts = write_sharded_stack(
+        args.directory,
+        seed=args.seed,
+        years=args.years,
+        shard_years=args.shard_years,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - began
+    print(f"Wrote {args.years} years in {len(parts)} shards to {args.directory} in {elapsed:.2f}s ({args.years / elapsed:.0f} years/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -18,12 +18,61 @@ def build_parser() -> argparse.ArgumentParser:
         default=2084,
         help="Seed controlling the mythological randomization of epochs.",
     )
+    parser.add_argument(
+        "--profile-memory",
+        nargs="?",
+        const="all",
+        choices=("generator", "viewer", "all"),
+        help="Report tracemalloc memory use instead of opening the window.",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        default=100,
+        help="Epochs generated when profiling the generator.",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=300,
+        help="Headless frames rendered when profiling the viewer.",
+    )
+    parser.add_argument(
+        "--report-format",
+        choices=("text", "json"),
+        default="text",
+        help="Format of the memory report.",
+    )
+    parser.add_argument(
+        "--report-output",
+        help="Write the memory report to this file instead of stdout.",
+    )
     return parser
 
 
+def profile_memory(args: argparse.Namespace) -> int:
+    from codus_epoch.memprofile import profile_generator, profile_viewer, render_reports
+
+    reports = []
+    if args.profile_memory in ("generator", "all"):
+        reports.append(profile_generator(seed=args.seed, years=args.years))
+    if args.profile_memory in ("viewer", "all"):
+        reports.append(profile_viewer(seed=args.seed, frames=args.frames))
+
+    text = render_reports(reports, fmt=args.report_format)
+    if args.report_output:
+        with open(args.report_output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
 def main(argv: Iterable[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
+    if args.profile_memory:
+        return profile_memory(args)
     launch(seed=args.seed)
     return 0
 
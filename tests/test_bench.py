@@ -0,0 +1,47 @@
+"""Tests for the benchmark harness and its regression gate."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from codus_epoch.bench import BenchCase, find_regressions, main, measure
+from codus_epoch.epochs import generate_epoch_stack
+
+
+class BenchHarnessTest(unittest.TestCase):
+    def test_measure_reports_best_of_runs_and_retained_blocks(self) -> None:
+        case = BenchCase("generate[20]", lambda: generate_epoch_stack(seed=1, years=20), epochs_per_op=20)
+        result = measure(case, min_time=0.01, repeat=3)
+        self.assertEqual(result.repeat, 3)
+        self.assertGreaterEqual(result.ops_per_sec, result.ops_per_sec_median)
+        self.assertGreater(result.peak_bytes, 0)
+        self.assertGreater(result.retained_blocks_per_epoch, 0)
+
+    def test_compare_flags_only_cases_beyond_threshold(self) -> None:
+        baseline = {
+            "fast": {"ops_per_sec": 100.0, "peak_bytes": 1000},
+            "slow": {"ops_per_sec": 100.0, "peak_bytes": 1000},
+        }
+        current = {
+            "fast": {"ops_per_sec": 95.0, "peak_bytes": 1100},
+            "slow": {"ops_per_sec": 60.0, "peak_bytes": 1000},
+        }
+        problems = find_regressions(baseline, current, threshold=0.15, memory_threshold=0.25)
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].startswith("slow:"))
+
+    def test_compare_reports_cases_missing_from_the_run(self) -> None:
+        baseline = {"viewer/draw": {"ops_per_sec": 100.0, "peak_bytes": 1000}}
+        problems = find_regressions(baseline, {}, threshold=0.15, memory_threshold=0.25)
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].startswith("viewer/draw:"))
+
+    def test_compare_without_baseline_fails_cleanly(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            code = main(["compare", "--baseline", str(Path(tmp) / "missing.json")])
+        self.assertEqual(code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
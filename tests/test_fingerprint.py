@@ -0,0 +1,54 @@
+"""Tests for stack fingerprints and block-hash diffs."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from codus_epoch.epochs import generate_epoch_stack
+from codus_epoch.fingerprint import diff_fingerprints, diff_stacks, export_stack, fingerprint
+
+
+class FingerprintDiffTest(unittest.TestCase):
+    def test_same_seed_matches_and_export_round_trips(self) -> None:
+        stack = generate_epoch_stack(seed=2201)
+        self.assertEqual(fingerprint(stack).root, fingerprint(generate_epoch_stack(seed=2201)).root)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "stack.jsonl"
+            export_stack(stack, path)
+            self.assertEqual(fingerprint(path).root, fingerprint(stack).root)
+            self.assertTrue(diff_stacks(stack, path).identical)
+
+    def test_diff_finds_first_changed_year_and_fields(self) -> None:
+        original = generate_epoch_stack(seed=2201, years=1000)
+        edited = generate_epoch_stack(seed=2201, years=1000)
+        edited.epochs[637].status = "rewritten by an auditor"
+        edited.echoes[637] = "Echo 638: tampered."
+        result = diff_stacks(original, edited)
+        self.assertEqual(result.year, 638)
+        self.assertEqual(result.fields, ["status", "echo"])
+        self.assertLessEqual(result.node_comparisons, 2 * 8)
+
+    def test_diff_reports_truncated_stack(self) -> None:
+        result = diff_stacks(generate_epoch_stack(seed=5, years=40), generate_epoch_stack(seed=5, years=35))
+        self.assertEqual(result.index, 35)
+        self.assertEqual(result.fields, ["<missing year>"])
+
+    def test_export_diff_seeks_to_block_and_years_are_optional(self) -> None:
+        original = generate_epoch_stack(seed=9, years=200)
+        edited = generate_epoch_stack(seed=9, years=200)
+        edited.reflections[151] = "Reflection rewritten."
+        with tempfile.TemporaryDirectory() as tmp:
+            left, right = Path(tmp) / "left.jsonl", Path(tmp) / "right.jsonl"
+            export_stack(original, left)
+            export_stack(edited, right)
+            result = diff_stacks(left, right)
+            self.assertEqual((result.block, result.index, result.year), (15, 151, 152))
+            self.assertEqual(result.fields, ["reflection"])
+            self.assertIsNone(fingerprint(left).year_digests)
+            detailed = diff_fingerprints(fingerprint(left, keep_years=True), fingerprint(right, keep_years=True))
+            self.assertEqual(detailed.index, 151)
+
+
+if __name__ == "__main__":
+    unittest.main()
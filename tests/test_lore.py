@@ -0,0 +1,75 @@
+"""Tests for weighted lore tables and alias sampling."""
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from codus_epoch.epochs import UPGRADE_PATTERNS, generate_epoch_stack
+from codus_epoch.lore import AliasSampler, LoreTable, load_lore_table, parse_lore_lines
+
+
+class LoreTableTest(unittest.TestCase):
+    def test_alias_sampler_tracks_weights(self) -> None:
+        sampler = AliasSampler([1.0, 0.0, 3.0])
+        rng = random.Random(7)
+        counts = [0, 0, 0]
+        for _ in range(20000):
+            counts[sampler.sample(rng)] += 1
+        self.assertEqual(counts[1], 0)
+        self.assertAlmostEqual(counts[2] / counts[0], 3.0, delta=0.3)
+
+    def test_non_finite_weights_are_rejected(self) -> None:
+        for weights in ([1.0, float("nan"), 1.0], [1.0, float("inf")]):
+            with self.assertRaises(ValueError):
+                AliasSampler(weights)
+        with self.assertRaises(ValueError):
+            parse_lore_lines(["1\tsteady", "nan\tghost"], weighted=True)
+
+    def test_tuple_tables_require_matching_columns(self) -> None:
+        with self.assertRaises(ValueError):
+            generate_epoch_stack(seed=1, lore={"regrets": LoreTable(entries=["one column only"])})
+
+    def test_entry_shape_is_checked_once_per_table(self) -> None:
+        table = LoreTable(entries=[("fog promise", "Promised fog.")])
+        generate_epoch_stack(seed=1, years=3, lore={"regrets": table})
+        table.entries.append("one column only")  # already validated; not walked again
+        self.assertEqual(table.columns, 2)
+
+    def test_mythopatch_braces_other_than_year_are_literal(self) -> None:
+        stack = generate_epoch_stack(seed=4, years=3, lore={"mythopatches": ["v{year} set {css} vars {}"]})
+        self.assertEqual([epoch.mythopatch for epoch in stack.epochs], [f"v{year} set {{css}} vars {{}}" for year in (1, 2, 3)])
+
+    def test_unweighted_tables_keep_seed_output(self) -> None:
+        baseline = generate_epoch_stack(seed=2201)
+        custom = generate_epoch_stack(seed=2201, lore={"upgrades": LoreTable(entries=UPGRADE_PATTERNS)})
+        self.assertEqual(baseline, custom)
+
+    def test_weighted_corpus_round_trips_through_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = Path(tmp) / "upgrades.tsv"
+            corpus.write_text("# weight\tentry\n5\tforged a louder storm\n1\tforgot the storm\n", encoding="utf-8")
+            fresh = load_lore_table(corpus)
+            cached = load_lore_table(corpus)
+            self.assertTrue((Path(tmp) / "upgrades.tsv.lorecache").exists())
+            self.assertTrue(cached.weighted)
+            self.assertEqual(list(cached.entries), list(fresh.entries))
+            self.assertEqual(list(cached.sampler.prob), list(fresh.sampler.prob))
+            stack = generate_epoch_stack(seed=3, lore={"upgrades": cached})
+            self.assertTrue(all(epoch.upgrade in fresh.entries for epoch in stack.epochs))
+
+    def test_corrupt_cache_is_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = Path(tmp) / "regrets.tsv"
+            corpus.write_text("2\tfog promise\tPromised fog.\n1\tpalette loss\tLost it.\n", encoding="utf-8")
+            load_lore_table(corpus)
+            cache = Path(tmp) / "regrets.tsv.lorecache"
+            cache.write_bytes(cache.read_bytes()[:-6])
+            table = load_lore_table(corpus)
+            self.assertEqual(table.entries[0], ("fog promise", "Promised fog."))
+            self.assertEqual(len(table.sampler.alias), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for the tracemalloc memory profiling mode."""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from codus_epoch.memprofile import profile_generator, profile_viewer
+from main import main
+
+
+class MemoryProfileTest(unittest.TestCase):
+    def test_generator_report_attributes_epoch_allocations(self) -> None:
+        report = profile_generator(seed=2201, years=40)
+        self.assertGreater(report.bytes_per_epoch, 0)
+        self.assertEqual(report.object_counts.get("Epoch"), 40)
+        functions = {row.name for row in report.by_function}
+        self.assertIn("codus_epoch.epochs:generate_epoch_range", functions)
+
+    def test_reports_exclude_profiler_allocations(self) -> None:
+        report = profile_generator(seed=2201, years=40)
+        self.assertNotIn("codus_epoch.memprofile", {row.name for row in report.by_module})
+        self.assertFalse({"Snapshot", "_Traces", "Counter"} & set(report.object_counts))
+
+    def test_viewer_counts_surfaces_outside_tracemalloc(self) -> None:
+        report = profile_viewer(seed=2201, frames=12, samples=2)
+        if report.note.startswith("skipped"):
+            self.skipTest(report.note)
+        self.assertGreater(report.surfaces_created, 0)
+        self.assertGreater(report.surface_bytes, 0)
+        self.assertNotIn("codus_epoch.memprofile", {row.name for row in report.by_module})
+
+    def test_main_writes_json_report(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "memory.json"
+            code = main(
+                ["--profile-memory", "generator", "--years", "20", "--report-format", "json", "--report-output", str(output)]
+            )
+            self.assertEqual(code, 0)
+            report = json.loads(output.read_text(encoding="utf-8"))
+            self.assertEqual(report[0]["target"], "generator")
+
+
+if __name__ == "__main__":
+    unittest.main()
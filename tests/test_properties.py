@@ -0,0 +1,32 @@
+"""Tests for the seed-range property harness."""
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from codus_epoch import properties
+from codus_epoch.properties import run_properties
+
+
+class PropertyHarnessTest(unittest.TestCase):
+    def test_invariants_hold_across_a_seed_range(self) -> None:
+        report = run_properties(start=2190, count=20, years=80, workers=2, chunk=5, determinism=True)
+        self.assertEqual(report.checked, 20)
+        self.assertEqual(report.violations, [])
+        self.assertGreater(report.seeds_per_second, 0)
+
+    def test_violation_reports_minimal_horizon(self) -> None:
+        def late_years_fail(stack):
+            for epoch in stack.epochs:
+                if epoch.year >= 42:
+                    yield epoch.year, "synthetic failure"
+
+        with mock.patch.dict(properties.INVARIANTS, {"synthetic": late_years_fail}):
+            report = run_properties(start=7, count=2, years=60, workers=1, invariants=("synthetic",))
+        self.assertEqual([item.seed for item in report.violations], [7, 8])
+        self.assertEqual(report.violations[0].repro_years, 42)
+        self.assertEqual(report.violations[0].repro, "generate_epoch_stack(seed=7, years=42)")
+
+
+if __name__ == "__main__":
+    unittest.main()
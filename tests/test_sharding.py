@@ -0,0 +1,59 @@
+"""Tests for sharded single-timeline generation."""
+from __future__ import annotations
+
+from itertools import islice
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from codus_epoch.fingerprint import MANIFEST_NAME, fingerprint, iter_stack_records, write_records
+from codus_epoch.properties import check_stack
+from codus_epoch.sharding import generate_sharded_stack, write_sharded_stack
+
+
+class ShardedGenerationTest(unittest.TestCase):
+    def test_output_is_independent_of_worker_count(self) -> None:
+        serial = generate_sharded_stack(seed=11, years=95, shard_years=20, workers=1)
+        parallel = generate_sharded_stack(seed=11, years=95, shard_years=20, workers=2)
+        self.assertEqual(fingerprint(serial).root, fingerprint(parallel).root)
+        self.assertEqual([epoch.year for epoch in serial.epochs], list(range(1, 96)))
+
+    def test_shard_boundaries_keep_every_invariant(self) -> None:
+        stack = generate_sharded_stack(seed=11, years=95, shard_years=20, workers=1)
+        self.assertEqual(check_stack(stack, seed=11), [])
+        shorter = generate_sharded_stack(seed=11, years=47, shard_years=20, workers=1)
+        self.assertEqual(shorter.epochs, stack.epochs[:47])
+
+    def test_disk_shards_read_back_as_one_export(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            parts = write_sharded_stack(tmp, seed=11, years=95, shard_years=20, workers=2)
+            self.assertEqual(len(parts), 5)
+            stack = generate_sharded_stack(seed=11, years=95, shard_years=20, workers=1)
+            self.assertEqual(fingerprint(tmp).root, fingerprint(stack).root)
+
+    def test_rewrite_replaces_stale_parts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_sharded_stack(tmp, seed=11, years=95, shard_years=20, workers=1)
+            write_sharded_stack(tmp, seed=11, years=30, shard_years=20, workers=1)
+            self.assertEqual(sorted(path.name for path in Path(tmp).glob("part-*.jsonl")), ["part-00000.jsonl", "part-00001.jsonl"])
+            self.assertEqual(len(fingerprint(tmp)), 30)
+            manifest = json.loads((Path(tmp) / MANIFEST_NAME).read_text(encoding="utf-8"))
+            self.assertEqual((manifest["part_count"], manifest["years"]), (2, 30))
+
+    def test_parts_without_manifest_read_in_numeric_order(self) -> None:
+        stack = generate_sharded_stack(seed=11, years=30, shard_years=10, workers=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, start in (("part-100000.jsonl", 20), ("part-10000.jsonl", 0), ("part-10001.jsonl", 10)):
+                write_records(islice(iter_stack_records(stack), start, start + 10), Path(tmp) / name)
+            self.assertEqual(fingerprint(tmp).root, fingerprint(stack).root)
+
+    def test_unpicklable_intensity_needs_one_worker(self) -> None:
+        with self.assertRaises(ValueError):
+            generate_sharded_stack(seed=11, years=20, shard_years=10, workers=2, glitch_intensity=lambda year: 0.1)
+        stack = generate_sharded_stack(seed=11, years=20, shard_years=10, workers=1, glitch_intensity=lambda year: 0.1)
+        self.assertEqual(len(stack.epochs), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()